@@ -6,14 +6,59 @@ Built on Phase II optimized architecture for sub-10s response times
 """
 
 import asyncio
+from collections import Counter
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 import logging
 
 from google.adk.core import BaseAgent, BaseModel, prompt_template
-from .weather_api import WeatherGovAPIClient, get_real_time_fire_weather, WeatherStationData
+from .weather_api import WeatherGovAPIClient, close_shared_session, get_real_time_fire_weather, WeatherStationData
 
 logger = logging.getLogger(__name__)
 
+HIGH_RISK_THRESHOLD = 6.0      # Fire weather index above which a station is high risk
+MODERATE_RISK_THRESHOLD = 4.0  # Average index at or above which conditions are moderate
+
+# Prompt templates are constant; only the user prompt fields vary per query
+_SYSTEM_PROMPT = """You are a specialized Weather Analysis Agent for fire risk assessment.
+        
+        Your role:
+        - Analyze real-time weather data from Weather.gov API
+        - Calculate fire weather indices and risk factors
+        - Integrate with existing fire danger calculations
+        - Provide concise, actionable weather intelligence
+        
+        Key capabilities:
+        - Real-time weather data from 1000+ stations
+        - Fire weather index calculations
+        - Wind, temperature, humidity analysis for fire risk
+        - Data quality assessment and recommendations
+        
+        Response format:
+        - Lead with key fire weather insights
+        - Include specific station data when relevant
+        - Note data quality and any limitations
+        - Keep responses under 200 words for optimal performance
+        
+        Context: This agent operates within an optimized multi-agent fire risk system
+        with sub-10 second response time requirements."""
+
+_USER_PROMPT_TEMPLATE = """Analyze weather conditions for fire risk assessment.
+
+Query: {query}
+
+Instructions:
+- Focus on fire weather parameters (temperature, humidity, wind speed/direction)
+- Calculate fire weather indices when possible
+- Assess data quality and note any limitations
+- Provide actionable insights for fire risk management
+
+Station focus: {station_focus}
+Location context: {location}
+Include fire weather calculations: {include_fire_weather}
+
+Provide a concise analysis suitable for fire management decision-making."""
+
 class WeatherQuery(BaseModel):
     """Weather query model for agent input"""
     query: str
@@ -28,6 +73,16 @@ class WeatherResponse(BaseModel):
     fire_weather_analysis: Optional[str] = None
     data_quality_notes: List[str] = []
 
+@dataclass(slots=True)
+class SummaryInputs:
+    """Structured fire weather metrics used to route and build the analysis summary"""
+    query: str
+    n_stations: int
+    avg_fwi: float
+    max_fwi: float
+    has_high_risk: bool
+    fire_analysis: str
+
 class WeatherAgent(BaseAgent[WeatherQuery, WeatherResponse]):
     """
     Real-time weather analysis agent for fire risk assessment
@@ -39,7 +94,7 @@ class WeatherAgent(BaseAgent[WeatherQuery, WeatherResponse]):
     model_name = "gemini-2.0-flash-001"
     
     # Common fire weather stations across major fire regions
-    DEFAULT_FIRE_STATIONS = [
+    DEFAULT_FIRE_STATIONS = (
         'KCEC',  # Jack McNamara Field, Crescent City, CA (Northern CA fires)
         'KSTS',  # Charles M. Schulz Sonoma County, Santa Rosa, CA (Wine Country)
         'KMRY',  # Monterey Peninsula, Monterey, CA (Central CA coast)
@@ -50,50 +105,21 @@ class WeatherAgent(BaseAgent[WeatherQuery, WeatherResponse]):
         'KDEN',  # Denver International, Denver, CO (Mountain West)
         'KBOI',  # Boise Air Terminal, Boise, ID (Intermountain)
         'KPDX',  # Portland International, Portland, OR (Pacific Northwest)
-    ]
+    )
+    DEFAULT_TOP5 = DEFAULT_FIRE_STATIONS[:5]  # Default query set, limited for performance
     
     @prompt_template
     def system_prompt(self) -> str:
-        return """You are a specialized Weather Analysis Agent for fire risk assessment.
-        
-        Your role:
-        - Analyze real-time weather data from Weather.gov API
-        - Calculate fire weather indices and risk factors
-        - Integrate with existing fire danger calculations
-        - Provide concise, actionable weather intelligence
-        
-        Key capabilities:
-        - Real-time weather data from 1000+ stations
-        - Fire weather index calculations
-        - Wind, temperature, humidity analysis for fire risk
-        - Data quality assessment and recommendations
-        
-        Response format:
-        - Lead with key fire weather insights
-        - Include specific station data when relevant
-        - Note data quality and any limitations
-        - Keep responses under 200 words for optimal performance
-        
-        Context: This agent operates within an optimized multi-agent fire risk system
-        with sub-10 second response time requirements."""
+        return _SYSTEM_PROMPT
     
     @prompt_template
     def user_prompt(self, query: WeatherQuery) -> str:
-        return f"""Analyze weather conditions for fire risk assessment.
-
-Query: {query.query}
-
-Instructions:
-- Focus on fire weather parameters (temperature, humidity, wind speed/direction)
-- Calculate fire weather indices when possible
-- Assess data quality and note any limitations
-- Provide actionable insights for fire risk management
-
-Station focus: {', '.join(query.station_ids) if query.station_ids else 'General fire weather stations'}
-Location context: {query.location if query.location else 'Multi-region analysis'}
-Include fire weather calculations: {query.include_fire_weather}
-
-Provide a concise analysis suitable for fire management decision-making."""
+        return _USER_PROMPT_TEMPLATE.format(
+            query=query.query,
+            station_focus=', '.join(query.station_ids) if query.station_ids else 'General fire weather stations',
+            location=query.location if query.location else 'Multi-region analysis',
+            include_fire_weather=query.include_fire_weather
+        )
 
     async def run(self, query: WeatherQuery) -> WeatherResponse:
         """
@@ -107,7 +133,7 @@ Provide a concise analysis suitable for fire management decision-making."""
         """
         try:
             # Determine stations to query
-            station_ids = query.station_ids or self.DEFAULT_FIRE_STATIONS[:5]  # Limit for performance
+            station_ids = query.station_ids or self.DEFAULT_TOP5
             
             # Get real-time weather data
             logger.info(f"Fetching real-time weather for {len(station_ids)} stations")
@@ -119,13 +145,15 @@ Provide a concise analysis suitable for fire management decision-making."""
                     data_quality_notes=["Weather.gov API unreachable"]
                 )
             
-            # Analyze fire weather conditions
-            fire_weather_analysis = self._analyze_fire_weather_conditions(weather_data)
-            data_quality_notes = self._assess_overall_data_quality(weather_data)
+            # Analyze fire weather conditions off the event loop so other requests keep being served
+            fire_weather_analysis, data_quality_notes = await asyncio.gather(
+                asyncio.to_thread(self._analyze_fire_weather_conditions, weather_data),
+                asyncio.to_thread(self._assess_overall_data_quality, weather_data)
+            )
             
             # Generate AI-powered analysis summary
-            analysis_context = self._prepare_analysis_context(query, weather_data, fire_weather_analysis)
-            ai_summary = await self._generate_ai_summary(analysis_context)
+            summary_inputs = self._prepare_analysis_context(query, weather_data, fire_weather_analysis)
+            ai_summary = await self._generate_ai_summary(summary_inputs)
             
             return WeatherResponse(
                 summary=ai_summary,
@@ -141,6 +169,10 @@ Provide a concise analysis suitable for fire management decision-making."""
                 data_quality_notes=["Analysis error - check logs"]
             )
     
+    async def close(self) -> None:
+        """Release the shared Weather.gov HTTP session; call on shutdown, before the event loop exits"""
+        await close_shared_session()
+    
     def _analyze_fire_weather_conditions(self, weather_data: Dict[str, Dict]) -> str:
         """Analyze fire weather conditions across stations"""
         if not weather_data:
@@ -155,7 +187,7 @@ Provide a concise analysis suitable for fire management decision-making."""
             fire_indices.append(fire_index)
             
             # High risk threshold
-            if fire_index > 6.0:
+            if fire_index > HIGH_RISK_THRESHOLD:
                 high_risk_stations.append(f"{data.get('station_name', station_id)} ({fire_index:.1f})")
         
         if fire_indices:
@@ -182,16 +214,17 @@ Provide a concise analysis suitable for fire management decision-making."""
             return quality_notes
         
         total_stations = len(weather_data)
-        quality_counts = {}
-        
-        for station_id, data in weather_data.items():
-            quality = data.get('fire_weather', {}).get('data_quality', 'UNKNOWN')
-            quality_counts[quality] = quality_counts.get(quality, 0) + 1
+        quality_counts = Counter(
+            data.get('fire_weather', {}).get('data_quality', 'UNKNOWN')
+            for data in weather_data.values()
+        )
+        poor = quality_counts['POOR']
+        excellent = quality_counts['EXCELLENT']
         
-        if quality_counts.get('POOR', 0) > total_stations * 0.3:
+        if poor > total_stations * 0.3:
             quality_notes.append("Data quality concerns: >30% of stations have poor data")
         
-        if quality_counts.get('EXCELLENT', 0) > total_stations * 0.7:
+        if excellent > total_stations * 0.7:
             quality_notes.append("Excellent data quality: >70% of stations have complete data")
         
         if total_stations < 3:
@@ -199,53 +232,38 @@ Provide a concise analysis suitable for fire management decision-making."""
         
         return quality_notes
     
-    def _prepare_analysis_context(self, query: WeatherQuery, weather_data: Dict, fire_analysis: str) -> str:
-        """Prepare context for AI analysis"""
-        context_parts = [
-            f"Weather Query: {query.query}",
-            f"Stations Analyzed: {len(weather_data)}",
-            f"Fire Weather Analysis: {fire_analysis}",
+    def _prepare_analysis_context(self, query: WeatherQuery, weather_data: Dict, fire_analysis: str) -> SummaryInputs:
+        """Prepare structured context for AI analysis"""
+        fire_indices = [
+            data.get('fire_weather', {}).get('fire_weather_index', 0)
+            for data in weather_data.values()
         ]
+        max_fwi = max(fire_indices, default=0.0)
         
-        # Add sample station data
-        if weather_data:
-            sample_station = next(iter(weather_data.values()))
-            conditions = sample_station.get('current_conditions', {})
-            context_parts.append(
-                f"Sample Conditions: {conditions.get('temperature', 'N/A')}°F, "
-                f"{conditions.get('humidity', 'N/A')}% RH, "
-                f"{conditions.get('wind_speed', 'N/A')} mph"
-            )
-        
-        return " | ".join(context_parts)
+        return SummaryInputs(
+            query=query.query,
+            n_stations=len(weather_data),
+            avg_fwi=sum(fire_indices) / len(fire_indices) if fire_indices else 0.0,
+            max_fwi=max_fwi,
+            has_high_risk=max_fwi > HIGH_RISK_THRESHOLD,
+            fire_analysis=fire_analysis
+        )
     
-    async def _generate_ai_summary(self, context: str) -> str:
+    async def _generate_ai_summary(self, inputs: SummaryInputs) -> str:
         """Generate AI-powered weather analysis summary"""
         try:
-            # Use the existing model to generate analysis
-            analysis_prompt = f"""Provide a concise fire weather analysis based on:
-
-{context}
-
-Focus on:
-1. Current fire weather conditions and risk level
-2. Key factors affecting fire behavior (wind, humidity, temperature)
-3. Actionable recommendations for fire management
-
-Keep response under 150 words for optimal performance."""
-
             # This would integrate with the existing model infrastructure
             # For now, return a structured summary based on available data
-            if "High risk stations" in context:
+            if inputs.has_high_risk:
                 return "⚠️ ELEVATED FIRE WEATHER CONDITIONS detected. Multiple stations showing high fire weather indices. Recommend increased fire weather monitoring and readiness. Wind and low humidity are primary risk factors."
-            elif "Average index" in context and "4." in context:
+            elif inputs.avg_fwi >= MODERATE_RISK_THRESHOLD:
                 return "🔥 MODERATE FIRE WEATHER CONDITIONS across monitored stations. Fire weather indices in moderate range. Standard fire weather precautions recommended."
             else:
                 return "✅ NORMAL FIRE WEATHER CONDITIONS with low to moderate fire weather indices. Continue routine fire weather monitoring."
                 
         except Exception as e:
             logger.error(f"AI summary generation error: {e}")
-            return f"Weather data analysis complete. {len(weather_data) if 'weather_data' in locals() else 0} stations processed. See detailed data for specific conditions."
+            return f"Weather data analysis complete. {inputs.n_stations} stations processed. See detailed data for specific conditions."
 
 # Create agent instance
 weather_agent = WeatherAgent()
@@ -302,6 +320,8 @@ if __name__ == "__main__":
             print(f"\n⚠️ Data Quality Notes:")
             for note in result['data_quality']:
                 print(f"   - {note}")
+        
+        await weather_agent.close()
     
     # Run test
     asyncio.run(test_weather_agent())
\ No newline at end of file
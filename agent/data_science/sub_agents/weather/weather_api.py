@@ -6,17 +6,44 @@ Built on Phase II optimized performance foundation
 """
 
 import asyncio
+import random
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple
+import importlib.util
 import logging
-import aiohttp
+import httpx
 import json
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Safety net for installs without the declared orjson; stdlib json.loads also accepts raw bytes
+    _json_loads = json.loads
+
+# h2 ships with the declared httpx[http2] extra; fall back to HTTP/1.1 if it is missing
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Weather.gov unitCode -> (multiplier, offset) converting to fire weather units (°F, mph, ft)
+_UNIT_CONV: Dict[str, Tuple[float, float]] = {
+    "wmoUnit:degC": (9 / 5, 32.0),
+    "wmoUnit:km_h-1": (0.621371, 0.0),
+    "wmoUnit:m": (3.28084, 0.0),
+    "wmoUnit:percent": (1.0, 0.0),
+    "wmoUnit:degree_(angle)": (1.0, 0.0),
+    "wmoUnit:Pa": (1.0, 0.0),
+}
+_NO_CONV: Tuple[float, float] = (1.0, 0.0)
+
+# Throttling responses worth retrying after a backoff
+_RETRY_STATUSES = frozenset({429, 503})
+
+@dataclass(slots=True, eq=False)
 class WeatherStationData:
     """Weather station data structure for real-time integration"""
     station_id: str
@@ -34,6 +61,78 @@ class WeatherStationData:
     last_updated: Optional[datetime] = None
     data_quality: str = "UNKNOWN"
 
+# Process-wide HTTP session so DNS resolution and the TLS handshake happen once,
+# not on every WeatherGovAPIClient context; bound to the event loop that created it
+_shared_session: Optional[httpx.AsyncClient] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _discard_stale_session(session: httpx.AsyncClient, owner_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Release a session bound to another event loop before it is replaced"""
+    if owner_loop is not None and owner_loop.is_running():
+        # The owning loop is alive in another thread; its transports must be closed there
+        asyncio.run_coroutine_threadsafe(session.aclose(), owner_loop)
+    else:
+        # A finished loop can no longer close its transports; the owner should have
+        # called close_shared_session() before the loop exited
+        logger.warning("Discarding Weather.gov session left open by a finished event loop")
+
+def _get_shared_session(headers: Dict[str, str], timeout: float) -> httpx.AsyncClient:
+    """Return the shared Weather.gov session, creating it for the running event loop if needed"""
+    global _shared_session, _shared_session_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.is_closed or _shared_session_loop is not loop:
+        if _shared_session is not None and not _shared_session.is_closed:
+            _discard_stale_session(_shared_session, _shared_session_loop)
+        
+        # Over HTTP/2 all station requests multiplex on one TLS connection; the pool is left
+        # unpinned so a server that only negotiates HTTP/1.1 still gets parallel connections
+        _shared_session = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=headers,
+            timeout=timeout
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+async def close_shared_session() -> None:
+    """
+    Close the shared Weather.gov session
+    
+    The session is owned by whoever runs the event loop: call this (or WeatherAgent.close)
+    before the loop exits, since its connections cannot be closed once the loop is gone.
+    """
+    global _shared_session, _shared_session_loop
+    
+    if _shared_session is not None:
+        if _shared_session_loop is asyncio.get_running_loop():
+            await _shared_session.aclose()
+        elif not _shared_session.is_closed:
+            _discard_stale_session(_shared_session, _shared_session_loop)
+    _shared_session = None
+    _shared_session_loop = None
+
+# Process-wide cap on in-flight Weather.gov requests, shared by every WeatherGovAPIClient
+# so concurrent agent queries cannot multiply it; bound to the event loop that created it
+_shared_gate: Optional[asyncio.Semaphore] = None
+_shared_gate_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_shared_gate(limit: int) -> asyncio.Semaphore:
+    """Return the shared request gate, creating it for the running event loop if needed"""
+    global _shared_gate, _shared_gate_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_gate is None or _shared_gate_loop is not loop:
+        _shared_gate = asyncio.Semaphore(limit)
+        _shared_gate_loop = loop
+    return _shared_gate
+
+# Process-wide station cache and HTTP validators, shared by every WeatherGovAPIClient so
+# a later agent query within the TTL reuses data and sends conditional GETs
+_station_cache: Dict[str, WeatherStationData] = {}
+_station_last_update: Dict[str, float] = {}
+_station_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
 class WeatherGovAPIClient:
     """
     Real-time Weather.gov API client for fire weather analysis
@@ -43,6 +142,10 @@ class WeatherGovAPIClient:
     """
     
     BASE_URL = "https://api.weather.gov"
+    MAX_CONCURRENT_REQUESTS = 8  # Stay within Weather.gov polite-use rate limits
+    MAX_RETRIES = 3
+    REQUEST_TIMEOUT_SECONDS = 8.0  # Keep a slow station inside the sub-10s response budget
+    STATION_BATCH_SIZE = 500  # Maximum page size of the /stations collection endpoint
     
     def __init__(self, update_interval_minutes: int = 5):
         """
@@ -51,10 +154,13 @@ class WeatherGovAPIClient:
         Args:
             update_interval_minutes: How often to refresh data (default: 5 minutes)
         """
-        self.update_interval = timedelta(minutes=update_interval_minutes)
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.cache: Dict[str, WeatherStationData] = {}
-        self.last_update: Dict[str, datetime] = {}
+        self._ttl_seconds = update_interval_minutes * 60
+        self.session: Optional[httpx.AsyncClient] = None
+        self.cache: Dict[str, WeatherStationData] = _station_cache
+        # Monotonic fetch times (time.monotonic()) for cache freshness checks
+        self.last_update: Dict[str, float] = _station_last_update
+        # HTTP cache validators (ETag, Last-Modified) from each station's last observation
+        self.validators: Dict[str, Tuple[Optional[str], Optional[str]]] = _station_validators
         
         # Headers as recommended by Weather.gov API docs
         self.headers = {
@@ -64,13 +170,33 @@ class WeatherGovAPIClient:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        self.session = _get_shared_session(self.headers, self.REQUEST_TIMEOUT_SECONDS)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (the shared session stays open for reuse)"""
+        self.session = None
+    
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Mapping[str, str], bytes]:
+        """
+        GET a Weather.gov URL under the concurrency gate
+        
+        Throttled responses (429/503) are retried with jittered exponential backoff,
+        sleeping outside the gate so other requests can proceed.
+        
+        Returns:
+            Tuple of (status, response headers, body); body is empty unless status is 200
+        """
+        gate = _get_shared_gate(self.MAX_CONCURRENT_REQUESTS)
+        for attempt in range(self.MAX_RETRIES):
+            async with gate:
+                response = await self.session.get(url, headers=headers)
+            
+            if response.status_code not in _RETRY_STATUSES or attempt == self.MAX_RETRIES - 1:
+                body = response.content if response.status_code == 200 else b''
+                return response.status_code, response.headers, body
+            
+            await asyncio.sleep(0.5 * 2 ** attempt + random.uniform(0, 0.5))
     
     async def get_station_info(self, station_id: str) -> Optional[WeatherStationData]:
         """
@@ -88,29 +214,50 @@ class WeatherGovAPIClient:
         try:
             # Get station metadata
             station_url = f"{self.BASE_URL}/stations/{station_id}"
-            async with self.session.get(station_url) as response:
-                if response.status != 200:
-                    logger.warning(f"Station {station_id} not found: {response.status}")
-                    return None
-                
-                station_data = await response.json()
-                properties = station_data.get('properties', {})
-                geometry = station_data.get('geometry', {})
-                coordinates = geometry.get('coordinates', [0, 0, 0])
-                
-                return WeatherStationData(
-                    station_id=station_id,
-                    name=properties.get('name', 'Unknown'),
-                    state=properties.get('state', 'Unknown'),
-                    longitude=coordinates[0] if len(coordinates) > 0 else 0.0,
-                    latitude=coordinates[1] if len(coordinates) > 1 else 0.0,
-                    elevation=coordinates[2] if len(coordinates) > 2 else 0.0
-                )
+            status, _, body = await self._fetch(station_url)
+            if status != 200:
+                logger.warning(f"Station {station_id} not found: {status}")
+                return None
+            
+            return self._station_from_feature(station_id, _json_loads(body))
                 
         except Exception as e:
             logger.error(f"Error fetching station info for {station_id}: {e}")
             return None
     
+    async def get_stations_info_batch(self, station_ids: List[str]) -> Dict[str, WeatherStationData]:
+        """
+        Get metadata for many stations with one request per batch of STATION_BATCH_SIZE
+        
+        Args:
+            station_ids: Weather station identifiers
+            
+        Returns:
+            Dictionary mapping station_id to WeatherStationData for stations found
+        """
+        if not self.session:
+            raise RuntimeError("WeatherGovAPIClient must be used as async context manager")
+        
+        stations = {}
+        for i in range(0, len(station_ids), self.STATION_BATCH_SIZE):
+            batch = station_ids[i:i + self.STATION_BATCH_SIZE]
+            try:
+                stations_url = f"{self.BASE_URL}/stations?id={','.join(batch)}&limit={len(batch)}"
+                status, _, body = await self._fetch(stations_url)
+                if status != 200:
+                    logger.warning(f"Station batch lookup failed: {status}")
+                    continue
+                
+                for feature in _json_loads(body).get('features', []):
+                    station_id = feature.get('properties', {}).get('stationIdentifier')
+                    if station_id:
+                        stations[station_id] = self._station_from_feature(station_id, feature)
+                        
+            except Exception as e:
+                logger.error(f"Error fetching station batch {batch}: {e}")
+        
+        return stations
+    
     async def get_current_observations(self, station_id: str) -> Optional[WeatherStationData]:
         """
         Get current weather observations for a station
@@ -131,74 +278,122 @@ class WeatherGovAPIClient:
         try:
             # Get latest observations
             obs_url = f"{self.BASE_URL}/stations/{station_id}/observations/latest"
-            async with self.session.get(obs_url) as response:
-                if response.status != 200:
-                    logger.warning(f"No observations for {station_id}: {response.status}")
+            status, headers, body = await self._fetch(obs_url, self._conditional_headers(station_id))
+            if status == 304:
+                # Observation unchanged since the last fetch; keep the cached data
+                self.last_update[station_id] = time.monotonic()
+                return self.cache[station_id]
+            
+            if status != 200:
+                logger.warning(f"No observations for {station_id}: {status}")
+                return None
+            
+            properties = self._parse_observation_properties(body)
+            
+            # Get station info if not cached
+            if station_id not in self.cache:
+                station_info = await self.get_station_info(station_id)
+                if not station_info:
                     return None
-                
-                obs_data = await response.json()
-                properties = obs_data.get('properties', {})
-                
-                # Get station info if not cached
-                if station_id not in self.cache:
-                    station_info = await self.get_station_info(station_id)
-                    if not station_info:
-                        return None
-                    self.cache[station_id] = station_info
-                
-                # Update with current observations
-                station_data = self.cache[station_id]
-                station_data.temperature = self._extract_value(properties.get('temperature'))
-                station_data.relative_humidity = self._extract_value(properties.get('relativeHumidity'))
-                station_data.wind_speed = self._extract_value(properties.get('windSpeed'))
-                station_data.wind_direction = self._extract_value(properties.get('windDirection'))
-                station_data.precipitation = self._extract_value(properties.get('precipitationLastHour'))
-                station_data.barometric_pressure = self._extract_value(properties.get('barometricPressure'))
-                station_data.last_updated = datetime.utcnow()
-                station_data.data_quality = self._assess_data_quality(station_data)
-                
-                # Update cache timestamp
-                self.last_update[station_id] = datetime.utcnow()
-                
-                return station_data
+                self.cache[station_id] = station_info
+            
+            # Update with current observations
+            station_data = self.cache[station_id]
+            station_data.temperature = self._extract_value(properties.get('temperature'))
+            station_data.relative_humidity = self._extract_value(properties.get('relativeHumidity'))
+            station_data.wind_speed = self._extract_value(properties.get('windSpeed'))
+            station_data.wind_direction = self._extract_value(properties.get('windDirection'))
+            station_data.precipitation = self._extract_value(properties.get('precipitationLastHour'))
+            station_data.barometric_pressure = self._extract_value(properties.get('barometricPressure'))
+            station_data.last_updated = datetime.utcnow()
+            station_data.data_quality = self._assess_data_quality(station_data)
+            
+            # Update cache timestamp and validators for the next conditional GET
+            self.last_update[station_id] = time.monotonic()
+            self.validators[station_id] = (headers.get('ETag'), headers.get('Last-Modified'))
+            
+            return station_data
                 
         except Exception as e:
             logger.error(f"Error fetching observations for {station_id}: {e}")
             return None
     
-    async def get_multiple_stations(self, station_ids: List[str]) -> Dict[str, WeatherStationData]:
+    async def iter_current_observations(self, station_ids: List[str]) -> AsyncIterator[WeatherStationData]:
         """
-        Get current observations for multiple stations efficiently
+        Yield current observations for multiple stations as each request completes
         
         Args:
             station_ids: List of weather station identifiers
             
-        Returns:
-            Dictionary mapping station_id to WeatherStationData
+        Yields:
+            WeatherStationData for each station with available observations
         """
-        tasks = []
-        for station_id in station_ids:
-            task = asyncio.create_task(self.get_current_observations(station_id))
-            tasks.append((station_id, task))
+        # Prewarm metadata for uncached stations in one request instead of one per station
+        uncached = [station_id for station_id in station_ids if station_id not in self.cache]
+        if len(uncached) > 1:
+            self.cache.update(await self.get_stations_info_batch(uncached))
         
-        results = {}
-        for station_id, task in tasks:
+        tasks = [asyncio.create_task(self.get_current_observations(station_id)) for station_id in station_ids]
+        
+        for next_done in asyncio.as_completed(tasks):
             try:
-                station_data = await task
+                station_data = await next_done
                 if station_data:
-                    results[station_id] = station_data
+                    yield station_data
             except Exception as e:
-                logger.error(f"Error processing {station_id}: {e}")
+                logger.error(f"Error processing station observations: {e}")
+    
+    async def get_multiple_stations(self, station_ids: List[str]) -> Dict[str, WeatherStationData]:
+        """
+        Get current observations for multiple stations efficiently
         
-        return results
+        Args:
+            station_ids: List of weather station identifiers
+            
+        Returns:
+            Dictionary mapping station_id to WeatherStationData
+        """
+        return {
+            station_data.station_id: station_data
+            async for station_data in self.iter_current_observations(station_ids)
+        }
     
     def _is_data_fresh(self, station_id: str) -> bool:
         """Check if cached data is still fresh"""
-        if station_id not in self.last_update:
+        last_update = self.last_update.get(station_id)
+        if last_update is None:
             return False
         
-        time_since_update = datetime.utcnow() - self.last_update[station_id]
-        return time_since_update < self.update_interval
+        return time.monotonic() - last_update < self._ttl_seconds
+    
+    def _station_from_feature(self, station_id: str, feature: Dict) -> WeatherStationData:
+        """Build station metadata from a Weather.gov station GeoJSON feature"""
+        properties = feature.get('properties', {})
+        geometry = feature.get('geometry', {})
+        coordinates = geometry.get('coordinates', [0, 0, 0])
+        
+        return WeatherStationData(
+            station_id=station_id,
+            name=properties.get('name', 'Unknown'),
+            state=properties.get('state', 'Unknown'),
+            longitude=coordinates[0] if len(coordinates) > 0 else 0.0,
+            latitude=coordinates[1] if len(coordinates) > 1 else 0.0,
+            elevation=coordinates[2] if len(coordinates) > 2 else 0.0
+        )
+    
+    def _conditional_headers(self, station_id: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from cached validators"""
+        etag, last_modified = self.validators.get(station_id, (None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    def _parse_observation_properties(self, raw: bytes) -> Dict:
+        """Extract the observation properties from a raw response"""
+        return _json_loads(raw).get('properties', {})
     
     def _extract_value(self, measurement: Optional[Dict]) -> Optional[float]:
         """Extract numeric value from Weather.gov measurement object"""
@@ -210,18 +405,8 @@ class WeatherGovAPIClient:
             return None
         
         try:
-            # Convert from Celsius to Fahrenheit for temperature
-            unit_code = measurement.get('unitCode', '')
-            if 'celsius' in unit_code.lower() or 'degC' in unit_code:
-                return (float(value) * 9/5) + 32
-            elif 'meter' in unit_code.lower() and 'wind' not in unit_code.lower():
-                # Convert meters to feet for elevation
-                return float(value) * 3.28084
-            elif 'kilometer' in unit_code.lower():
-                # Convert km/h to mph for wind speed
-                return float(value) * 0.621371
-            else:
-                return float(value)
+            multiplier, offset = _UNIT_CONV.get(measurement.get('unitCode', ''), _NO_CONV)
+            return float(value) * multiplier + offset
         except (ValueError, TypeError):
             return None
     
@@ -294,6 +479,31 @@ class FireWeatherCalculator:
         except Exception as e:
             logger.error(f"Error calculating fire weather index: {e}")
             return None
+    
+    @staticmethod
+    def calculate_fire_weather_index_batch(temps: np.ndarray, rh: np.ndarray,
+                                           wind: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized fire weather calculation across many stations at once
+        
+        Args:
+            temps: Temperatures (°F), one per station
+            rh: Relative humidity (%), one per station
+            wind: Wind speeds (mph), NaN where unavailable
+            
+        Returns:
+            Dictionary of per-station factor arrays, same keys as the scalar calculation
+        """
+        drought_factor = np.clip((100 - rh) / 10, 0, 10)
+        wind_factor = np.minimum(10, np.where(np.isnan(wind), 1.0, wind / 5.0))
+        temp_factor = np.clip((temps - 32) / 10, 0, None)
+        
+        return {
+            'fire_weather_index': (drought_factor + wind_factor + temp_factor) / 3,
+            'drought_factor': drought_factor,
+            'wind_factor': wind_factor,
+            'temperature_factor': temp_factor,
+        }
 
 # Integration functions for existing agent system
 async def get_real_time_fire_weather(station_ids: List[str]) -> Dict[str, Dict]:
@@ -308,23 +518,47 @@ async def get_real_time_fire_weather(station_ids: List[str]) -> Dict[str, Dict]:
         Dictionary mapping station_id to fire weather calculations
     """
     async with WeatherGovAPIClient() as client:
-        weather_data = await client.get_multiple_stations(station_ids)
-        
         results = {}
-        for station_id, data in weather_data.items():
-            fire_weather = FireWeatherCalculator.calculate_fire_weather_index(data)
-            if fire_weather:
-                results[station_id] = {
-                    'station_name': data.name,
-                    'location': {'latitude': data.latitude, 'longitude': data.longitude},
-                    'current_conditions': {
-                        'temperature': data.temperature,
-                        'humidity': data.relative_humidity,
-                        'wind_speed': data.wind_speed,
-                        'wind_direction': data.wind_direction
-                    },
-                    'fire_weather': fire_weather
+        stations = []
+        temps, humidities, winds = [], [], []
+        
+        # Assemble each station's entry while slower stations are still in flight
+        async for data in client.iter_current_observations(station_ids):
+            # Stations without temperature and humidity cannot be scored
+            if not data.temperature or not data.relative_humidity:
+                continue
+            
+            stations.append(data)
+            temps.append(data.temperature)
+            humidities.append(data.relative_humidity)
+            winds.append(data.wind_speed or np.nan)
+            results[data.station_id] = {
+                'station_name': data.name,
+                'location': {'latitude': data.latitude, 'longitude': data.longitude},
+                'current_conditions': {
+                    'temperature': data.temperature,
+                    'humidity': data.relative_humidity,
+                    'wind_speed': data.wind_speed,
+                    'wind_direction': data.wind_direction
                 }
+            }
+        
+        if not stations:
+            return {}
+        
+        indices = FireWeatherCalculator.calculate_fire_weather_index_batch(
+            np.array(temps, dtype=float), np.array(humidities, dtype=float), np.array(winds, dtype=float)
+        )
+        
+        for i, data in enumerate(stations):
+            results[data.station_id]['fire_weather'] = {
+                'fire_weather_index': float(indices['fire_weather_index'][i]),
+                'drought_factor': float(indices['drought_factor'][i]),
+                'wind_factor': float(indices['wind_factor'][i]),
+                'temperature_factor': float(indices['temperature_factor'][i]),
+                'data_quality': data.data_quality,
+                'timestamp': data.last_updated.isoformat() if data.last_updated else None
+            }
         
         return results
 
@@ -348,6 +582,8 @@ if __name__ == "__main__":
             print(f"   Wind: {conditions.get('wind_speed', 'N/A')} mph")
             print(f"   Fire Weather Index: {fire_weather.get('fire_weather_index', 'N/A'):.2f}")
             print(f"   Data Quality: {fire_weather.get('data_quality', 'N/A')}")
+        
+        await close_shared_session()
     
     # Run test
     asyncio.run(test_weather_api())
\ No newline at end of file
@@ -14,6 +14,7 @@
 
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google.cloud import bigquery
 from pathlib import Path
 from dotenv import load_dotenv
@@ -25,6 +26,12 @@ print(env_file_path)
 # Load environment variables from the specified .env file
 load_dotenv(dotenv_path=env_file_path)
 
+# Every CSV load uses the same settings, so the job config is built once
+BASE_JOB_CONFIG = bigquery.LoadJobConfig(
+    source_format=bigquery.SourceFormat.CSV,
+    skip_leading_rows=1,  # Skip the header row
+    autodetect=True,  # Automatically detect the schema
+)
 
 def load_csv_to_bigquery(project_id, dataset_name, table_name, csv_filepath):
     """Loads a CSV file into a BigQuery table.
@@ -41,15 +48,9 @@ def load_csv_to_bigquery(project_id, dataset_name, table_name, csv_filepath):
     dataset_ref = client.dataset(dataset_name)
     table_ref = dataset_ref.table(table_name)
 
-    job_config = bigquery.LoadJobConfig(
-        source_format=bigquery.SourceFormat.CSV,
-        skip_leading_rows=1,  # Skip the header row
-        autodetect=True,  # Automatically detect the schema
-    )
-
     with open(csv_filepath, "rb") as source_file:
         job = client.load_table_from_file(
-            source_file, table_ref, job_config=job_config
+            source_file, table_ref, job_config=BASE_JOB_CONFIG
         )
 
     job.result()  # Wait for the job to complete
@@ -95,13 +96,19 @@ def main():
     print("Creating dataset.")
     create_dataset_if_not_exists(project_id, dataset_name)
 
-    # Load the train data
-    print("Loading train table.")
-    load_csv_to_bigquery(project_id, dataset_name, "train", train_csv_filepath)
-
-    # Load the test data
-    print("Loading test table.")
-    load_csv_to_bigquery(project_id, dataset_name, "test", test_csv_filepath)
+    # Load the train and test data concurrently; each load job is mostly
+    # upload and server-side wait time
+    tables = {"train": train_csv_filepath, "test": test_csv_filepath}
+    print(f"Loading {', '.join(tables)} tables.")
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        futures = [
+            executor.submit(
+                load_csv_to_bigquery, project_id, dataset_name, table_name, csv_filepath
+            )
+            for table_name, csv_filepath in tables.items()
+        ]
+        for future in as_completed(futures):
+            future.result()  # Re-raise any load failure
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the Weather.gov client and fire weather calculations."""
+
+import asyncio
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+# Load weather_api directly: the weather package __init__ also imports the
+# agent module and its ADK dependencies, which these tests do not need
+_WEATHER_API_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "data_science",
+        "sub_agents",
+        "weather",
+        "weather_api.py",
+    )
+)
+_spec = importlib.util.spec_from_file_location("weather_api", _WEATHER_API_PATH)
+weather_api = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(weather_api)
+
+
+def _station(station_id, temperature, relative_humidity, wind_speed):
+    return weather_api.WeatherStationData(
+        station_id=station_id,
+        name=f"{station_id} field",
+        state="CA",
+        latitude=38.0,
+        longitude=-120.0,
+        elevation=100.0,
+        temperature=temperature,
+        relative_humidity=relative_humidity,
+        wind_speed=wind_speed,
+        data_quality="GOOD",
+    )
+
+
+class TestFireWeatherBatch(unittest.TestCase):
+    """The batch path used by get_real_time_fire_weather matches the scalar calculation."""
+
+    STATIONS = [
+        _station("KHOT", 95.0, 8.0, 24.85),
+        _station("KCALM", 70.0, 40.0, 0.0),  # Zero wind scores as missing wind
+        _station("KNOWIND", 88.0, 15.0, None),
+        _station("KGUST", 60.0, 55.0, 80.0),  # Wind factor capped at 10
+        _station("KCOLD", 20.0, 90.0, 5.0),  # Temperature factor floored at 0
+        _station("KDRYRH", 90.0, 0.0, 10.0),  # RH 0 is skipped as missing
+        _station("KZERO", 0.0, 30.0, 10.0),  # Temperature 0 is skipped as missing
+    ]
+
+    def _run_live_path(self):
+        async def observations(client, station_ids):
+            for station in self.STATIONS:
+                yield station
+
+        async def fetch():
+            try:
+                return await weather_api.get_real_time_fire_weather(
+                    [station.station_id for station in self.STATIONS]
+                )
+            finally:
+                await weather_api.close_shared_session()
+
+        with mock.patch.object(
+            weather_api.WeatherGovAPIClient, "iter_current_observations", observations
+        ):
+            return asyncio.run(fetch())
+
+    def test_batch_matches_scalar(self):
+        results = self._run_live_path()
+
+        for station in self.STATIONS:
+            expected = weather_api.FireWeatherCalculator.calculate_fire_weather_index(
+                station
+            )
+            if expected is None:
+                self.assertNotIn(station.station_id, results)
+                continue
+
+            fire_weather = results[station.station_id]["fire_weather"]
+            for key in (
+                "fire_weather_index",
+                "drought_factor",
+                "wind_factor",
+                "temperature_factor",
+            ):
+                self.assertAlmostEqual(fire_weather[key], expected[key], msg=key)
+            self.assertEqual(fire_weather["data_quality"], expected["data_quality"])
+
+    def test_missing_wind_scores_one(self):
+        results = self._run_live_path()
+
+        self.assertEqual(results["KCALM"]["fire_weather"]["wind_factor"], 1.0)
+        self.assertEqual(results["KNOWIND"]["fire_weather"]["wind_factor"], 1.0)
+
+
+class TestExtractValue(unittest.TestCase):
+    """Weather.gov measurements are converted to fire weather units."""
+
+    def setUp(self):
+        self.client = weather_api.WeatherGovAPIClient()
+
+    def test_unit_conversions(self):
+        cases = {
+            "wmoUnit:degC": (30.0, 86.0),
+            "wmoUnit:km_h-1": (40.0, 24.85484),
+            "wmoUnit:m": (100.0, 328.084),
+            "wmoUnit:percent": (12.0, 12.0),
+            "wmoUnit:degree_(angle)": (270.0, 270.0),
+            "wmoUnit:Pa": (101325.0, 101325.0),
+        }
+        self.assertEqual(set(cases), set(weather_api._UNIT_CONV))
+
+        for unit_code, (value, expected) in cases.items():
+            measurement = {"unitCode": unit_code, "value": value}
+            self.assertAlmostEqual(
+                self.client._extract_value(measurement),
+                expected,
+                places=4,
+                msg=unit_code,
+            )
+
+    def test_unknown_unit_passes_through(self):
+        self.assertEqual(
+            self.client._extract_value({"unitCode": "wmoUnit:furlong", "value": 3}), 3.0
+        )
+
+    def test_missing_value(self):
+        self.assertIsNone(
+            self.client._extract_value({"unitCode": "wmoUnit:degC", "value": None})
+        )
+        self.assertIsNone(self.client._extract_value(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
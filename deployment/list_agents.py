@@ -1,12 +1,43 @@
 #!/usr/bin/env python3
 """List existing Agent Engine deployments."""
 
+import asyncio
+import json
 import os
+import time
+from pathlib import Path
 import vertexai
 from vertexai import agent_engines
 from dotenv import load_dotenv
 
-def list_existing_agents():
+# The agent roster rarely changes between re-runs, so listings are cached on disk briefly
+CACHE_DIR = Path.home() / ".cache" / "firewatch"
+CACHE_TTL_SECONDS = 60
+
+def _load_cached_agents(cache_file: Path):
+    """Return cached agent summaries if the cache file is younger than the TTL."""
+    try:
+        if time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+    return None
+
+async def _fetch_agents():
+    """Fetch agent summaries from the Vertex AI control plane."""
+    # The SDK pager blocks on each page fetch, so keep it off the event loop
+    agents = await asyncio.to_thread(lambda: list(agent_engines.list()))
+    return [
+        {
+            "resource_name": agent.resource_name,
+            "create_time": str(agent.create_time),
+            "update_time": str(agent.update_time),
+            "display_name": getattr(agent, "display_name", None),
+        }
+        for agent in agents
+    ]
+
+async def list_existing_agents():
     """List all existing agent deployments."""
     load_dotenv()
     
@@ -17,13 +48,22 @@ def list_existing_agents():
     print(f"📍 Location: {location}")
     print("-" * 60)
     
-    # Initialize Vertex AI
-    vertexai.init(project=project_id, location=location)
+    cache_file = CACHE_DIR / f"agents_{project_id}_{location}.json"
     
     try:
-        # List all agent engines
-        agents_generator = agent_engines.list()
-        agents = list(agents_generator)  # Convert generator to list
+        agents = _load_cached_agents(cache_file)
+        if agents is not None:
+            print(f"(cached listing, less than {CACHE_TTL_SECONDS}s old)")
+        else:
+            # Initialize Vertex AI
+            vertexai.init(project=project_id, location=location)
+            
+            agents = await _fetch_agents()
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(agents))
+            except OSError:
+                pass  # Caching is best-effort
         
         if not agents:
             print("❌ No existing agents found in this project/location.")
@@ -34,11 +74,11 @@ def list_existing_agents():
         
         for i, agent in enumerate(agents, 1):
             print(f"🤖 Agent #{i}:")
-            print(f"   Resource Name: {agent.resource_name}")
-            print(f"   Create Time: {agent.create_time}")
-            print(f"   Update Time: {agent.update_time}")
-            if hasattr(agent, 'display_name'):
-                print(f"   Display Name: {agent.display_name}")
+            print(f"   Resource Name: {agent['resource_name']}")
+            print(f"   Create Time: {agent['create_time']}")
+            print(f"   Update Time: {agent['update_time']}")
+            if agent['display_name'] is not None:
+                print(f"   Display Name: {agent['display_name']}")
             print()
             
     except Exception as e:
@@ -46,4 +86,4 @@ def list_existing_agents():
         print("This might indicate no agents exist or permission issues.")
 
 if __name__ == "__main__":
-    list_existing_agents() 
\ No newline at end of file
+    asyncio.run(list_existing_agents())
\ No newline at end of file
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Simple test of the existing agent with basic questions."""
 
+import sys
+import time
 import vertexai
 from vertexai import agent_engines
 
+# Streamed tokens are flushed at most this often rather than once per chunk
+FLUSH_INTERVAL_SECONDS = 0.05
+
 def simple_test():
     """Test with very basic questions."""
     project_id = "risenone-ai-prototype"
@@ -28,40 +33,47 @@ def simple_test():
             "Can you tell me about your capabilities?",
         ]
         
-        for i, question in enumerate(simple_questions, 1):
-            print(f"\n🔥 Test {i}: {question}")
-            
-            try:
-                # Create session and query
-                session = remote_agent.create_session(user_id="simple_test_user")
-                session_name = session.get('name') if isinstance(session, dict) else session.resource_name
-                
-                print(f"   📋 Session: {session_name}")
-                
-                response_stream = remote_agent.stream_query(
-                    session=session_name,
-                    input=question
-                )
+        # One session serves every question instead of a create/delete round-trip per question
+        session = remote_agent.create_session(user_id="simple_test_user")
+        session_name = session.get('name') if isinstance(session, dict) else session.resource_name
+        print(f"📋 Session: {session_name}")
+        
+        try:
+            for i, question in enumerate(simple_questions, 1):
+                print(f"\n🔥 Test {i}: {question}")
                 
-                print(f"   🤖 Response: ", end="")
-                full_response = ""
-                for chunk in response_stream:
-                    if hasattr(chunk, 'text') and chunk.text:
-                        full_response += chunk.text
-                        print(chunk.text, end="", flush=True)
+                try:
+                    response_stream = remote_agent.stream_query(
+                        session=session_name,
+                        input=question
+                    )
+                    
+                    print(f"   🤖 Response: ", end="")
+                    response_parts = []
+                    last_flush = time.monotonic()
+                    for chunk in response_stream:
+                        if hasattr(chunk, 'text') and chunk.text:
+                            response_parts.append(chunk.text)
+                            sys.stdout.write(chunk.text)
+                            now = time.monotonic()
+                            if now - last_flush >= FLUSH_INTERVAL_SECONDS:
+                                sys.stdout.flush()
+                                last_flush = now
+                    sys.stdout.flush()
+                    full_response = "".join(response_parts)
+                            
+                    if not full_response:
+                        print("(No response received)")
+                    else:
+                        print()  # New line
                         
-                if not full_response:
-                    print("(No response received)")
-                else:
-                    print()  # New line
+                    print(f"   ✅ Success")
                     
-                print(f"   ✅ Success")
-                
-                # Clean up
-                remote_agent.delete_session(session=session_name)
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+                except Exception as e:
+                    print(f"   ❌ Error: {e}")
+        finally:
+            # Clean up
+            remote_agent.delete_session(session=session_name)
                 
     except Exception as e:
         print(f"❌ Connection Error: {e}")
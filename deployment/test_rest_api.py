@@ -2,28 +2,23 @@
 """Test the existing agent using REST API calls."""
 
 import json
-import subprocess
-import requests
 import os
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 
-def get_access_token():
-    """Get the current access token."""
-    result = subprocess.run(
-        ["gcloud", "auth", "application-default", "print-access-token"], 
-        capture_output=True, text=True
+def get_authorized_session():
+    """Get a keep-alive HTTP session authorized with application-default credentials."""
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
     )
-    return result.stdout.strip()
+    return AuthorizedSession(credentials)
 
 def test_rest_api():
     """Test the agent using REST API."""
     base_url = "https://us-central1-aiplatform.googleapis.com/v1/projects/risenone-ai-prototype/locations/us-central1/reasoningEngines/5957884075011211264"
     
-    # Get access token
-    token = get_access_token()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    # Credentials refresh in-process and both calls reuse one connection
+    http = get_authorized_session()
     
     print("🧪 Testing RisenOne Agent via REST API")
     print("=" * 60)
@@ -39,7 +34,7 @@ def test_rest_api():
     }
     
     try:
-        session_response = requests.post(session_url, headers=headers, json=session_data)
+        session_response = http.post(session_url, json=session_data)
         print(f"   Status: {session_response.status_code}")
         print(f"   Response: {session_response.text}")
         
@@ -58,7 +53,7 @@ def test_rest_api():
                 }
             }
             
-            query_response = requests.post(query_url, headers=headers, json=query_data)
+            query_response = http.post(query_url, json=query_data)
             print(f"   Status: {query_response.status_code}")
             print(f"   Response: {query_response.text}")
             
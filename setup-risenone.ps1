@@ -258,12 +258,21 @@ def test_agent():
                                  stdout=subprocess.PIPE, 
                                  stderr=subprocess.PIPE)
         
-        # Give it time to start
+        # Wait until the server accepts connections, bailing out early if it exits
+        import socket
         import time
-        time.sleep(3)
+        ready = False
+        deadline = time.monotonic() + 30
+        while process.poll() is None and time.monotonic() < deadline:
+            try:
+                socket.create_connection(('localhost', 8000), timeout=0.1).close()
+                ready = True
+                break
+            except OSError:
+                time.sleep(0.1)
         
-        # Check if process is running
-        if process.poll() is None:
+        # Check if server is accepting connections
+        if ready:
             print("✅ ADK web server started successfully")
             print("🌐 Visit: http://localhost:8000")
             print("💬 Test query: 'Hi, What data do you have access to?'")
@@ -273,6 +282,8 @@ def test_agent():
             return True
         else:
             print("❌ ADK web server failed to start")
+            if process.poll() is None:
+                process.terminate()  # Timed out waiting for the port
             stdout, stderr = process.communicate()
             print(f"Error: {stderr.decode()}")
             return False